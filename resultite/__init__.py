@@ -15,13 +15,14 @@ from .core import (
 )
 
 # ---- New, richer API -------------------------------------------------------
-from .result import Result, Ok, Err, resultify, async_resultify
+from .result import Result, Ok, Err, resultify, resultify_many, async_resultify
 
 __all__ = [
     "Result",
     "Ok",
     "Err",
     "resultify",
+    "resultify_many",
     "async_resultify",
     "T",
     "U",
@@ -19,6 +19,22 @@ The public surface is kept deliberately small:
 * ``Err(exc)``      – wraps an :class:`Exception` instance.
 * ``resultify`` / ``async_resultify`` – convenience decorators turning a
   function that might raise into one that returns a :class:`Result`.
+* ``resultify_many`` – :func:`resultify` applied to a batch of callables.
+
+``Ok`` and ``Err`` are ``@final`` and must not be subclassed: the module relies
+on exact ``type(x) is Ok`` / ``type(x) is Err`` checks wherever it needs to
+tell the two apart, which is only equivalent to ``isinstance`` because no
+further subclasses exist.
+
+Both concrete classes support structural pattern matching, which lets callers
+branch on a result without going through :pymeth:`Result.is_ok` /
+:pymeth:`Result.unwrap`::
+
+    match result:
+        case Ok(value):
+            ...
+        case Err(error):
+            ...
 
 All heavy lifting happens on the two concrete subclasses.  Most methods are
 implemented twice – a synchronous version as well as an ``async`` one – to
@@ -28,12 +44,14 @@ The implementation purposefully avoids *any* external dependencies and only
 relies on the standard library.
 """
 
+from functools import wraps
 from typing import (  # noqa: D401 – we want to expose these in __all__
     TypeVar,
     Generic,
     Callable,
     Awaitable,
     Any,
+    Iterable,
     final,
 )
 
@@ -47,6 +65,7 @@ __all__ = [
     "Ok",
     "Err",
     "resultify",
+    "resultify_many",
     "async_resultify",
 ]
 
@@ -63,29 +82,33 @@ class Result(Generic[T, E]):
     subclasses.
     """
 
+    # No per-instance ``__dict__`` – the concrete subclasses declare their own
+    # slots, which only takes effect if every base class does so too.
+    __slots__ = ()
+
     # Prevent direct instantiation of the base class – it is purely abstract.
+    # ``Ok`` / ``Err`` define their own ``__init__`` so this never runs for
+    # them, which is why no ``self.__class__ is Result`` check is needed.
     def __init__(self) -> None:
-        if self.__class__ is Result:
-            raise TypeError(
-                "Cannot instantiate abstract class 'Result' directly.  Use Ok() "
-                "or Err() instead."
-            )
+        raise TypeError(
+            "Cannot instantiate abstract class 'Result' directly.  Use Ok() "
+            "or Err() instead."
+        )
 
     # ---------------------------------------------------------------------
-    # Query helpers – these do *not* inspect internal state of subclasses but
-    # rely on `isinstance` checks.  This makes the implementation tiny and the
-    # *contracts* of the methods crystal clear.
+    # Query helpers – each subclass answers with a constant, so no type check
+    # is performed at call time.
     # ---------------------------------------------------------------------
 
-    def is_ok(self) -> bool:  # noqa: D401 – deliberate short name
+    def is_ok(self) -> bool:  # pragma: no cover – abstract method
         """Return *True* if this is an :class:`Ok` value."""
 
-        return isinstance(self, Ok)
+        raise NotImplementedError
 
-    def is_err(self) -> bool:  # noqa: D401 – deliberate short name
+    def is_err(self) -> bool:  # pragma: no cover – abstract method
         """Return *True* if this is an :class:`Err` value."""
 
-        return isinstance(self, Err)
+        raise NotImplementedError
 
     # ------------------------------------------------------------------
     # Value extraction helpers – must be provided by subclasses.
@@ -110,6 +133,20 @@ class Result(Generic[T, E]):
 
         raise NotImplementedError
 
+    def map_unchecked(self, func: Callable[[T], U]) -> "Result[U, E]":  # noqa: D401
+        """Like :pymeth:`map` but *without* capturing exceptions.
+
+        Skips the ``try``/``except`` guard, so *func* must not raise – any
+        exception propagates to the caller instead of becoming an :class:`Err`.
+        """
+
+        raise NotImplementedError
+
+    def map_nothrow(self, func: Callable[[T], U]) -> "Result[U, E]":  # noqa: D401
+        """Alias of :pymeth:`map_unchecked`."""
+
+        raise NotImplementedError
+
     def map_err(self, func: Callable[[E], F]) -> "Result[T, F]":  # noqa: D401
         """Map a function over the *error* – subclass specific."""
 
@@ -120,6 +157,34 @@ class Result(Generic[T, E]):
 
         raise NotImplementedError
 
+    def flat_map(self, func: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":  # noqa: D401
+        """Alias of :pymeth:`and_then`."""
+
+        raise NotImplementedError
+
+    def map_flat(self, func: Callable[[T], Any]) -> "Result[Any, E]":  # noqa: D401
+        """Map *func* over the success value, flattening a :class:`Result` return.
+
+        If *func* returns an :class:`Ok` or :class:`Err` it is returned as-is
+        (``and_then`` semantics); any other value is wrapped in :class:`Ok`
+        (``map`` semantics).  Avoids the ``Ok(Ok(x))`` nesting :pymeth:`map`
+        would produce for Result-returning callables.
+        """
+
+        raise NotImplementedError
+
+    def pipe(self, *funcs: Callable[[Any], Any]) -> "Result[Any, E]":  # noqa: D401
+        """Apply *funcs* in order to the success value in a single pass.
+
+        Equivalent to a chain of :pymeth:`map` / :pymeth:`and_then` calls
+        without allocating an intermediate :class:`Result` for every step.  A
+        step returning an :class:`Ok` is unwrapped (``and_then`` semantics), a
+        step returning an :class:`Err` short-circuits the pipeline, and any
+        other return value is used as-is (``map`` semantics).
+        """
+
+        raise NotImplementedError
+
     # ------------------------------------------------------------------
     # Async versions – forward to subclass implementation.
     # ------------------------------------------------------------------
@@ -132,15 +197,6 @@ class Result(Generic[T, E]):
     ) -> "Result[U, E]":  # noqa: D401
         raise NotImplementedError
 
-    # ------------------------------------------------------------------
-    # Equality helpers – subclasses inherit these definitions but override
-    # `__eq__` for *value* comparisons.  Here we only implement rich comparison
-    # with other types to *co-operate* with subclass overrides.
-    # ------------------------------------------------------------------
-
-    def __ne__(self, other: object) -> bool:  # type: ignore[override]
-        return not self.__eq__(other)  # type: ignore[misc]
-
 
 # ---------------------------------------------------------------------------
 # Success branch – Ok
@@ -152,19 +208,31 @@ class Ok(Result[T, E]):
     """Wrap a successful *value* inside a :class:`Result`."""
 
     __slots__ = ("_value",)
+    __match_args__ = ("_value",)
 
     def __init__(self, value: T):
-        # Bypass base-class check by *not* calling super().__init__() – we do
-        # not want the *abstract* constructor raising TypeError.
-        object.__setattr__(self, "_value", value)
+        self._value = value
 
     # -------------- built-ins ------------------------------------------------
 
     def __repr__(self) -> str:  # noqa: D401 – useful debug output
         return f"Ok({self._value!r})"
 
-    def __eq__(self, other: object) -> bool:  # noqa: D401 – see base comment
-        return isinstance(other, Ok) and self._value == other._value  # type: ignore[attr-defined]
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Ok, (self._value,))
+
+    def __eq__(self, other: object) -> bool:  # noqa: D401
+        if self is other:
+            return True
+        return type(other) is Ok and self._value == other._value  # type: ignore[attr-defined]
+
+    # ------------- queries --------------------------------------------------
+
+    def is_ok(self) -> bool:  # noqa: D401
+        return True
+
+    def is_err(self) -> bool:  # noqa: D401
+        return False
 
     # ------------- extraction ----------------------------------------------
 
@@ -180,17 +248,47 @@ class Ok(Result[T, E]):
         try:
             return Ok(func(self._value))
         except Exception as exc:  # noqa: BLE001 – we *want* to capture broadly
-            return Err(exc)  # type: ignore[arg-type]
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
+
+    def map_unchecked(self, func: Callable[[T], U]) -> "Result[U, E]":  # noqa: D401
+        return Ok(func(self._value))
+
+    map_nothrow = map_unchecked
 
     def map_err(self, func: Callable[[E], F]) -> "Result[T, F]":  # noqa: D401
-        # Nothing to map – error branch ignored.
-        return Ok(self._value)  # type: ignore[type-var]
+        # Nothing to map – error branch ignored.  ``Ok`` is immutable, so the
+        # instance itself can be handed back.
+        return self  # type: ignore[return-value]
 
     def and_then(self, func: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":  # noqa: D401
         try:
             return func(self._value)
         except Exception as exc:  # noqa: BLE001
-            return Err(exc)  # type: ignore[arg-type]
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
+
+    flat_map = and_then
+
+    def map_flat(self, func: Callable[[T], Any]) -> "Result[Any, E]":  # noqa: D401
+        try:
+            value = func(self._value)
+        except Exception as exc:  # noqa: BLE001
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
+        if type(value) is Ok or type(value) is Err:
+            return value
+        return Ok(value)
+
+    def pipe(self, *funcs: Callable[[Any], Any]) -> "Result[Any, E]":  # noqa: D401
+        value = self._value
+        try:
+            for func in funcs:
+                value = func(value)
+                if type(value) is Ok:
+                    value = value._value
+                elif type(value) is Err:
+                    return value
+        except Exception as exc:  # noqa: BLE001
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
+        return Ok(value)
 
     # ---------------- async variants ----------------------------------------
 
@@ -198,7 +296,7 @@ class Ok(Result[T, E]):
         try:
             return Ok(await func(self._value))
         except Exception as exc:  # noqa: BLE001
-            return Err(exc)  # type: ignore[arg-type]
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
 
     async def and_then_async(
         self, func: Callable[[T], Awaitable["Result[U, E]"]]
@@ -206,7 +304,12 @@ class Ok(Result[T, E]):
         try:
             return await func(self._value)
         except Exception as exc:  # noqa: BLE001
-            return Err(exc)  # type: ignore[arg-type]
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
+
+
+# Shared ``Ok(None)`` returned by ``resultify`` wrappers around functions that
+# return nothing.  Safe to reuse because ``Ok`` is immutable.
+_OK_NONE: Ok[None, Any] = Ok(None)
 
 
 # ---------------------------------------------------------------------------
@@ -219,19 +322,46 @@ class Err(Result[T, E]):
     """Wrap an *Exception* inside a :class:`Result`."""
 
     __slots__ = ("_error",)
+    __match_args__ = ("_error",)
 
     def __init__(self, error: E):
         if not isinstance(error, Exception):
             raise TypeError("Err expects an Exception instance.")
-        object.__setattr__(self, "_error", error)
+        self._error = error
+
+    @classmethod
+    def _from_trusted(cls, error: E) -> "Err[T, E]":
+        """Build an :class:`Err` from an exception already known to be valid.
+
+        Used internally for values coming straight out of an ``except
+        Exception`` clause, where the ``isinstance`` check in :pymeth:`__init__`
+        would be redundant.
+        """
+
+        err = object.__new__(cls)
+        err._error = error
+        return err
 
     # -------------- built-ins ------------------------------------------------
 
     def __repr__(self) -> str:  # noqa: D401 – debug output
         return f"Err({self._error!r})"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Err, (self._error,))
+
     def __eq__(self, other: object) -> bool:  # noqa: D401
-        return isinstance(other, Err) and self._error == other._error  # type: ignore[attr-defined]
+        if self is other:
+            return True
+        return type(other) is Err and self._error == other._error  # type: ignore[attr-defined]
+
+    # ------------- queries --------------------------------------------------
+
+    def is_ok(self) -> bool:  # noqa: D401
+        return False
+
+    def is_err(self) -> bool:  # noqa: D401
+        return True
 
     # ------------- extraction ----------------------------------------------
 
@@ -246,28 +376,42 @@ class Err(Result[T, E]):
     # ------------- mapping --------------------------------------------------
 
     def map(self, func: Callable[[T], U]) -> "Result[U, E]":  # noqa: D401
-        # Successful value is absent – pass error through.
-        return Err(self._error)  # type: ignore[type-var]
+        # Successful value is absent – pass error through.  ``Err`` is
+        # immutable, so there is no need to allocate a copy.
+        return self  # type: ignore[return-value]
+
+    def map_unchecked(self, func: Callable[[T], U]) -> "Result[U, E]":  # noqa: D401
+        return self  # type: ignore[return-value]
+
+    map_nothrow = map_unchecked
 
     def map_err(self, func: Callable[[E], F]) -> "Result[T, F]":  # noqa: D401
         try:
             return Err(func(self._error))
         except Exception as exc:  # noqa: BLE001
-            return Err(exc)  # type: ignore[arg-type]
+            return Err._from_trusted(exc)  # type: ignore[arg-type]
 
     def and_then(self, func: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":  # noqa: D401
         # Already failed – propagate.
-        return Err(self._error)  # type: ignore[type-var]
+        return self  # type: ignore[return-value]
+
+    flat_map = and_then
+
+    def map_flat(self, func: Callable[[T], Any]) -> "Result[Any, E]":  # noqa: D401
+        return self  # type: ignore[return-value]
+
+    def pipe(self, *funcs: Callable[[Any], Any]) -> "Result[Any, E]":  # noqa: D401
+        return self  # type: ignore[return-value]
 
     # ---------------- async variants ----------------------------------------
 
     async def map_async(self, func: Callable[[T], Awaitable[U]]) -> "Result[U, E]":  # noqa: D401
-        return Err(self._error)  # type: ignore[type-var]
+        return self  # type: ignore[return-value]
 
     async def and_then_async(
         self, func: Callable[[T], Awaitable["Result[U, E]"]]
     ) -> "Result[U, E]":  # noqa: D401
-        return Err(self._error)  # type: ignore[type-var]
+        return self  # type: ignore[return-value]
 
 
 # ---------------------------------------------------------------------------
@@ -275,6 +419,33 @@ class Err(Result[T, E]):
 # ---------------------------------------------------------------------------
 
 
+def _make_wrapper(
+    func: Callable[..., T],
+    ok: Callable[[Any], Result[Any, Any]],
+    err: Callable[[Exception], Result[Any, Any]],
+) -> Callable[..., Result[T, Exception]]:
+    """Build the :func:`resultify` wrapper for *func*.
+
+    *ok* and *err* are bound as closure variables so the wrapper never has to
+    look them up as globals on each call.  A ``None`` return is mapped to the
+    shared ``Ok(None)`` instead of allocating a fresh one.
+    """
+
+    ok_none = _OK_NONE
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Result[T, Exception]:  # type: ignore[type-var]
+        try:
+            value = func(*args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            return err(exc)
+        if value is None:
+            return ok_none  # type: ignore[return-value]
+        return ok(value)
+
+    return wrapper  # type: ignore[return-value]
+
+
 def resultify(func: Callable[..., T]) -> Callable[..., Result[T, Exception]]:
     """Decorator turning *func* into one returning :class:`Result`.
 
@@ -283,18 +454,21 @@ def resultify(func: Callable[..., T]) -> Callable[..., Result[T, Exception]]:
     be captured and returned as :class:`Err`.
     """
 
-    def wrapper(*args: Any, **kwargs: Any) -> Result[T, Exception]:  # type: ignore[type-var]
-        try:
-            return Ok(func(*args, **kwargs))
-        except Exception as exc:  # noqa: BLE001
-            return Err(exc)
+    return _make_wrapper(func, Ok, Err._from_trusted)
 
-    # Preserve introspection metadata.
-    wrapper.__name__ = func.__name__
-    wrapper.__qualname__ = func.__qualname__
-    wrapper.__doc__ = func.__doc__
-    wrapper.__annotations__ = func.__annotations__.copy()
-    return wrapper  # type: ignore[return-value]
+
+def resultify_many(
+    funcs: Iterable[Callable[..., T]]
+) -> list[Callable[..., Result[T, Exception]]]:
+    """Apply :func:`resultify` to every callable in *funcs* in a single pass.
+
+    Handy at library boundaries where many functions are wrapped at once; the
+    ``Ok`` / ``Err`` constructors are resolved a single time for the whole
+    batch.
+    """
+
+    ok, err = Ok, Err._from_trusted
+    return [_make_wrapper(func, ok, err) for func in funcs]
 
 
 def async_resultify(
@@ -302,14 +476,14 @@ def async_resultify(
 ) -> Callable[..., Awaitable[Result[T, Exception]]]:
     """Async counterpart of :func:`resultify`."""
 
+    @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Result[T, Exception]:  # type: ignore[type-var]
         try:
-            return Ok(await func(*args, **kwargs))
+            value = await func(*args, **kwargs)
         except Exception as exc:  # noqa: BLE001
-            return Err(exc)
+            return Err._from_trusted(exc)
+        if value is None:
+            return _OK_NONE  # type: ignore[return-value]
+        return Ok(value)
 
-    wrapper.__name__ = func.__name__  # type: ignore[attr-defined]
-    wrapper.__qualname__ = func.__qualname__  # type: ignore[attr-defined]
-    wrapper.__doc__ = func.__doc__
-    wrapper.__annotations__ = func.__annotations__.copy()
     return wrapper  # type: ignore[return-value] 
\ No newline at end of file
@@ -1,4 +1,7 @@
 import asyncio
+import copy
+import functools
+import pickle
 import unittest
 from typing import Any, Callable
 
@@ -7,6 +10,7 @@ from resultite.result import (
     Err,
     Result,
     resultify,
+    resultify_many,
     async_resultify,
 )
 
@@ -60,6 +64,55 @@ class TestResultAPI(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(Ok(1).is_err())
         self.assertTrue(Err(ValueError()).is_err())
 
+    def test_result_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Result()  # type: ignore[abstract]
+
+    def test_inequality(self):
+        self.assertNotEqual(Ok(1), Ok(2))
+        self.assertNotEqual(Ok(1), Err(ValueError()))
+        self.assertFalse(Ok(1) != Ok(1))
+
+    def test_equality_short_circuits_on_identity(self):
+        nan = float("nan")
+        ok = Ok(nan)
+        self.assertEqual(ok, ok)
+        self.assertFalse(ok != ok)
+        err = Err(ValueError())
+        self.assertEqual(err, err)
+
+    def test_instances_have_no_dict(self):
+        self.assertFalse(hasattr(Ok(1), "__dict__"))
+        self.assertFalse(hasattr(Err(ValueError()), "__dict__"))
+
+    def test_copy_and_pickle_round_trip(self):
+        protocols = range(pickle.HIGHEST_PROTOCOL + 1)
+        for ok in (Ok(1), Ok(None), Ok([1, 2])):
+            self.assertEqual(copy.copy(ok), ok)
+            self.assertEqual(copy.deepcopy(ok), ok)
+            for protocol in protocols:
+                self.assertEqual(pickle.loads(pickle.dumps(ok, protocol)), ok)
+
+        err = Err(ValueError("bad"))
+        self.assertEqual(copy.copy(err), err)
+        restored = [copy.deepcopy(err)]
+        restored += [pickle.loads(pickle.dumps(err, protocol)) for protocol in protocols]
+        for res in restored:
+            self.assertTrue(res.is_err())
+            self.assertEqual(str(res._error), "bad")  # noqa: SLF001
+
+    def test_pattern_matching(self):
+        def describe(res: Result[int, Exception]) -> str:
+            match res:
+                case Ok(value):
+                    return f"ok:{value}"
+                case Err(error):
+                    return f"err:{error}"
+            return "unreachable"
+
+        self.assertEqual(describe(Ok(3)), "ok:3")
+        self.assertEqual(describe(Err(ValueError("bad"))), "err:bad")
+
     # --- unwrap / unwrap_or ---------------------------------------------
 
     def test_unwrap_success(self):
@@ -84,9 +137,31 @@ class TestResultAPI(unittest.IsolatedAsyncioTestCase):
         err_val: Result[int, ValueError] = Err(exc)
         self.assertEqual(err_val.map(inc), Err(exc))
 
+    def test_err_propagation_returns_same_instance(self):
+        err = Err(ValueError("x"))
+        self.assertIs(err.map(inc), err)
+        self.assertIs(err.and_then(lambda x: Ok(x)), err)
+
     def test_map_function_raises(self):
         res = Ok(1).map(fail)
         self.assertTrue(res.is_err())
+        self.assertEqual(res, Err(res._error))  # noqa: SLF001
+
+    def test_err_rejects_non_exception(self):
+        with self.assertRaises(TypeError):
+            Err("not an exception")  # type: ignore[arg-type]
+
+    def test_map_unchecked(self):
+        self.assertEqual(Ok(1).map_unchecked(inc), Ok(2))
+        err = Err(ValueError("x"))
+        self.assertIs(err.map_unchecked(inc), err)
+        with self.assertRaises(ValueError):
+            Ok(1).map_unchecked(fail)
+
+    def test_map_nothrow_alias(self):
+        self.assertEqual(Ok(1).map_nothrow(inc), Ok(2))
+        err = Err(ValueError("x"))
+        self.assertIs(err.map_nothrow(inc), err)
 
     # --- map_err --------------------------------------------------------
 
@@ -101,6 +176,8 @@ class TestResultAPI(unittest.IsolatedAsyncioTestCase):
 
     def test_map_err_noop_on_ok(self):
         self.assertEqual(Ok(2).map_err(lambda e: RuntimeError("unused")), Ok(2))
+        ok = Ok(2)
+        self.assertIs(ok.map_err(lambda e: RuntimeError("unused")), ok)
 
     # --- and_then (bind) -------------------------------------------------
 
@@ -116,6 +193,42 @@ class TestResultAPI(unittest.IsolatedAsyncioTestCase):
         res = Ok(2).and_then(lambda x: Err(ValueError("fail")))
         self.assertTrue(res.is_err())
 
+    def test_flat_map_alias(self):
+        self.assertEqual(Ok(2).flat_map(lambda x: Ok(x * 10)), Ok(20))
+        err = Err(ValueError())
+        self.assertIs(err.flat_map(lambda x: Ok(x)), err)
+
+    def test_map_flat(self):
+        inner = Ok(3)
+        self.assertIs(Ok(2).map_flat(lambda x: inner), inner)
+        self.assertEqual(Ok(2).map_flat(inc), Ok(3))
+        self.assertTrue(Ok(2).map_flat(lambda x: Err(ValueError())).is_err())
+        self.assertTrue(Ok(2).map_flat(fail).is_err())
+        err = Err(ValueError())
+        self.assertIs(err.map_flat(inc), err)
+
+    # --- pipe -----------------------------------------------------------
+
+    def test_pipe_mixes_map_and_and_then(self):
+        res = Ok(1).pipe(inc, lambda x: Ok(x * 10), inc)
+        self.assertEqual(res, Ok(21))
+        self.assertEqual(Ok(1).pipe(), Ok(1))
+
+    def test_pipe_short_circuits_on_err(self):
+        calls = []
+        err = Err(ValueError("stop"))
+        res = Ok(1).pipe(lambda x: err, calls.append)
+        self.assertIs(res, err)
+        self.assertEqual(calls, [])
+
+    def test_pipe_captures_exception(self):
+        res = Ok(1).pipe(inc, fail, inc)
+        self.assertTrue(res.is_err())
+
+    def test_pipe_on_err(self):
+        err = Err(ValueError())
+        self.assertIs(err.pipe(inc), err)
+
     # --- async map / and_then ------------------------------------------
 
     async def test_map_async_ok(self):
@@ -123,8 +236,10 @@ class TestResultAPI(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(res, Ok(4))
 
     async def test_map_async_err(self):
-        res = await Err(ValueError()).map_async(async_inc)
+        err = Err(ValueError())
+        res = await err.map_async(async_inc)
         self.assertTrue(res.is_err())
+        self.assertIs(res, err)
 
     async def test_and_then_async_ok(self):
         res = await Ok(5).and_then_async(lambda x: asyncio.sleep(0, result=Ok(x + 1)))
@@ -140,11 +255,60 @@ class TestResultAPI(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(maybe_raise_wrapped(0), Ok(0))
         self.assertTrue(maybe_raise_wrapped(1).is_err())
 
+    def test_resultify_preserves_metadata(self):
+        self.assertEqual(maybe_raise_wrapped.__name__, "maybe_raise_wrapped")
+        self.assertEqual(async_maybe_raise_wrapped.__name__, "async_maybe_raise_wrapped")
+        self.assertTrue(hasattr(maybe_raise_wrapped, "__wrapped__"))
+
+    def test_resultify_captures_wrong_arguments(self):
+        res = resultify(lambda x: x)(1, 2)
+        self.assertTrue(res.is_err())
+        self.assertIsInstance(res._error, TypeError)  # noqa: SLF001
+
+    def test_resultify_respects_injecting_decorator(self):
+        def inject_extra(f: Callable[..., int]) -> Callable[..., int]:
+            @functools.wraps(f)
+            def shim(*args: Any, **kwargs: Any) -> int:
+                return f(*args, extra=1, **kwargs)
+
+            return shim
+
+        @inject_extra
+        def h(x: int, extra: int) -> int:
+            return x + extra
+
+        self.assertEqual(resultify(h)(1), Ok(2))
+        (wrapped_h,) = resultify_many([h])
+        self.assertEqual(wrapped_h(1), Ok(2))
+
+    def test_resultify_many(self):
+        def variadic(*args: int) -> int:
+            return sum(args)
+
+        wrapped_inc, wrapped_fail, wrapped_sum = resultify_many([inc, fail, variadic])
+        self.assertEqual(wrapped_inc(1), Ok(2))
+        self.assertTrue(wrapped_fail(1).is_err())
+        self.assertEqual(wrapped_sum(1, 2, 3), Ok(6))
+        self.assertEqual(wrapped_inc.__name__, "inc")
+        self.assertTrue(wrapped_inc(1, 2).is_err())
+
+    def test_resultify_shares_ok_none(self):
+        void = resultify(lambda: None)
+        self.assertIs(void(), void())
+        self.assertEqual(void(), Ok(None))
+
     async def test_async_resultify_decorator(self):
         self.assertEqual(await async_maybe_raise_wrapped(0), Ok(0))
         res = await async_maybe_raise_wrapped(1)
         self.assertTrue(res.is_err())
 
+    async def test_async_resultify_shares_ok_none(self):
+        @async_resultify
+        async def void() -> None:
+            return None
+
+        self.assertIs(await void(), await void())
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file